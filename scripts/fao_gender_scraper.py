@@ -26,28 +26,60 @@ python scripts/fao_gender_scraper.py --section publications --start-page 61 --ma
 Notes
 -----
 - By default, outputs are written under public/<section>.csv and <section>.json.
+- Listing pages are fetched --concurrency at a time (default 4); use --concurrency 1 for strictly serial requests.
+- Listing responses are cached by ETag/Last-Modified and body hash in .cache/fao_http_cache.json; on re-runs
+  unchanged pages (304, or 200 with identical HTML) reuse their previously parsed rows (disable with --no-http-cache).
 - The script sends a desktop-like User-Agent and uses retry logic to reduce 403/5xx errors.
+- Required: requests, beautifulsoup4. Optional speedups, each used automatically when installed:
+  pip install lxml selectolax pyahocorasick orjson python-dateutil brotli
+  (pyahocorasick scores article categories in one pass over the text instead of one scan per keyword;
+  with brotli installed, requests' default Accept-Encoding also offers br, so pages download smaller).
 - If your network blocks automated requests to fao.org, run this script from a different network
   or manually save the HTML and parse locally.
 """
 
 import argparse
 import csv
+import hashlib
+import heapq
 import json
+import multiprocessing
 import os
 import re
 import sys
+import tempfile
 import time
-from dataclasses import dataclass, asdict
-from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from collections import Counter
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
 import requests
-from bs4 import BeautifulSoup  # pip install beautifulsoup4
+from bs4 import BeautifulSoup, SoupStrainer  # pip install beautifulsoup4
 from urllib3.util.retry import Retry
 from requests.adapters import HTTPAdapter
 from datetime import datetime
 from urllib.parse import urlparse
 
+try:
+    import lxml.html as lxml_html  # pip install lxml (much faster than html.parser)
+    HTML_PARSER = "lxml"
+except ImportError:
+    lxml_html = None
+    HTML_PARSER = "html.parser"
+
+try:
+    import orjson  # pip install orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Lexbor-backed CSS selection is far cheaper than a bs4 tree walk for listings
+    from selectolax.lexbor import LexborHTMLParser  # pip install selectolax
+except ImportError:
+    LexborHTMLParser = None
 
 BASE = "https://www.fao.org"
 SECTIONS = {
@@ -62,8 +94,9 @@ SECTIONS = {
 }
 
 
-@dataclass
-class Item:
+class Item(NamedTuple):
+    # A NamedTuple rather than a dataclass: no per-instance __dict__, and rows are
+    # already tuples for the CSV/JSON writers
     section: str
     page: int
     title: str
@@ -79,7 +112,7 @@ class Item:
     article_text: str = ""
 
 
-def make_session() -> requests.Session:
+def _new_session(retries: Retry, pool_size: int) -> requests.Session:
     s = requests.Session()
     s.headers.update({
         "User-Agent": (
@@ -89,7 +122,18 @@ def make_session() -> requests.Session:
         ),
         "Accept-Language": "en-US,en;q=0.9",
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Connection": "keep-alive",
     })
+    # Everything lives on one host (fao.org): a larger keep-alive pool lets concurrent
+    # requests reuse connections instead of paying a fresh TLS handshake each time
+    adapter = HTTPAdapter(max_retries=retries, pool_connections=pool_size, pool_maxsize=pool_size)
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+
+def make_session(pool_size: int = 32) -> requests.Session:
+    """Session for listing pages: missing one truncates the scrape, so retry patiently."""
     retries = Retry(
         total=5,
         backoff_factor=0.6,
@@ -97,30 +141,129 @@ def make_session() -> requests.Session:
         allowed_methods=frozenset(["GET"]),
         raise_on_status=False,
     )
-    s.mount("https://", HTTPAdapter(max_retries=retries))
-    s.mount("http://", HTTPAdapter(max_retries=retries))
-    return s
+    return _new_session(retries, pool_size)
+
+
+def make_article_session(pool_size: int = 32) -> requests.Session:
+    """Session for article deep-fetches: a failed article only loses its text, so keep
+    the retry budget small (worst case well under a second of backoff instead of ~18s).
+    """
+    retries = Retry(
+        total=2,
+        backoff_factor=0.2,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        raise_on_status=False,
+    )
+    return _new_session(retries, pool_size)
 
 
+@lru_cache(maxsize=512)
 def build_page_url(section_key: str, page: int) -> str:
+    # SECTIONS already carries nested paths such as resources/e-learning
     path = SECTIONS[section_key]
     # Page 1 is .../<path>/en ; pages >=2 are .../<path>/<n>/en
-    if section_key == "e-learning":
-        # e-learning path includes 'resources' segment
-        return f"{BASE}/gender/{path}/en" if page == 1 else f"{BASE}/gender/{path}/{page}/en"
-    else:
-        return f"{BASE}/gender/{path}/en" if page == 1 else f"{BASE}/gender/{path}/{page}/en"
+    return f"{BASE}/gender/{path}/en" if page == 1 else f"{BASE}/gender/{path}/{page}/en"
+
+
+def load_http_cache(path: Optional[str]) -> Dict[str, Dict]:
+    """Load the per-URL listing cache ({url: {etag, last_modified, body_blake2b, rows}})."""
+    if not path or not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "rb") as f:
+            data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"WARN: ignoring unreadable HTTP cache {path}: {e}", file=sys.stderr)
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def save_http_cache(cache: Dict[str, Dict], path: Optional[str]) -> None:
+    if not path:
+        return
+    cache_dir = os.path.dirname(path)
+    if cache_dir:
+        os.makedirs(cache_dir, exist_ok=True)
+    with open(path, "wb") as f:
+        if orjson is not None:
+            f.write(orjson.dumps(cache))
+        else:
+            f.write(json.dumps(cache, ensure_ascii=False).encode("utf-8"))
+
+
+def body_digest(body: bytes) -> str:
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+
+def conditional_headers(entry: Optional[Dict]) -> Dict[str, str]:
+    """Build If-None-Match / If-Modified-Since headers from a cached entry."""
+    headers: Dict[str, str] = {}
+    if entry:
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+
+def _parse_listing_generic_lexbor(html: str) -> List[Tuple[str, str, str, str]]:
+    tree = LexborHTMLParser(html)
+    out: List[Tuple[str, str, str, str]] = []
+    for content in tree.css("div.d-list-content"):
+        title_tag = content.css_first("h5.title-link a")
+        date_tag = content.css_first("h6.date")
+        # Lexbor's node.css() may include the node itself; skip it by identity, not position
+        summary_div = next((d for d in content.css("div") if d.mem_id != content.mem_id), None)
+        title = title_tag.text(strip=True) if title_tag else ""
+        href = (title_tag.attributes.get("href") or "") if title_tag else ""
+        if href and href.startswith("/"):
+            href = f"{BASE}{href}"
+        date = date_tag.text(strip=True) if date_tag else ""
+        summary = summary_div.text(separator=" ", strip=True, skip_empty=True) if summary_div else ""
+        if title or date or href or summary:
+            out.append((title, date, href, summary))
+    return out
+
+
+def _parse_listing_elearning_lexbor(html: str) -> List[Tuple[str, str, str, str]]:
+    tree = LexborHTMLParser(html)
+    out: List[Tuple[str, str, str, str]] = []
+    for card in tree.css("div.card.card-elearning div.card-body"):
+        a = card.css_first("h5.card-title a.title-link")
+        date_tag = card.css_first("h6.date")
+        summary_p = card.css_first("p.card-text")
+        title = a.text(strip=True) if a else ""
+        href = (a.attributes.get("href") or "") if a else ""
+        if href and href.startswith("/"):
+            href = f"{BASE}{href}"
+        date = date_tag.text(strip=True) if date_tag else ""
+        summary = summary_p.text(separator=" ", strip=True, skip_empty=True) if summary_p else ""
+        if title or date or href or summary:
+            out.append((title, date, href, summary))
+    return out
+
+
+# Only build bs4 trees for the listing containers, not the whole page. E-learning keeps
+# the whole card so the "div.card.card-elearning div.card-body" selector still matches.
+# Regexes because the strainer sees the raw, unsplit class attribute.
+_GENERIC_STRAINER = SoupStrainer("div", class_=re.compile(r"(^|\s)d-list-content(\s|$)"))
+_ELEARNING_STRAINER = SoupStrainer("div", class_=re.compile(r"(^|\s)card-elearning(\s|$)"))
 
 
 def parse_listing_generic(html: str) -> List[Tuple[str, str, str, str]]:
     """Parse generic listing pages (news/insights/success-stories).
     Returns list of (title, date, url, summary) tuples.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    if LexborHTMLParser is not None:
+        return _parse_listing_generic_lexbor(html)
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=_GENERIC_STRAINER)
     out: List[Tuple[str, str, str, str]] = []
-    for content in soup.select("div.d-list-content"):
-        title_tag = content.select_one("h5.title-link a")
-        date_tag = content.select_one("h6.date")
+    # find()/find_all() rather than select(): simple tag+class lookups skip Soup Sieve's CSS compile
+    for content in soup.find_all("div", class_="d-list-content"):
+        heading = content.find("h5", class_="title-link")
+        title_tag = heading.find("a") if heading else None
+        date_tag = content.find("h6", class_="date")
         # summary is usually first immediate div inside .d-list-content
         summary_div = content.find("div")
         title = title_tag.get_text(strip=True) if title_tag else ""
@@ -134,222 +277,383 @@ def parse_listing_generic(html: str) -> List[Tuple[str, str, str, str]]:
         if summary_div:
             # Join all immediate text (strip nested tags gracefully)
             summary = summary_div.get_text(" ", strip=True)
-        if any([title, date, href, summary]):
+        if title or date or href or summary:
             out.append((title, date, href, summary))
     return out
 
 
+def _is_elearning_card(tag) -> bool:
+    classes = tag.get("class") or ()
+    return tag.name == "div" and "card" in classes and "card-elearning" in classes
+
+
 def parse_listing_elearning(html: str) -> List[Tuple[str, str, str, str]]:
     """Parse e-learning cards (structure differs).
     Returns list of (title, date, url, summary) tuples.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    if LexborHTMLParser is not None:
+        return _parse_listing_elearning_lexbor(html)
+    soup = BeautifulSoup(html, HTML_PARSER, parse_only=_ELEARNING_STRAINER)
     out: List[Tuple[str, str, str, str]] = []
-    for card in soup.select("div.card.card-elearning div.card-body"):
-        a = card.select_one("h5.card-title a.title-link")
-        date_tag = card.select_one("h6.date")
-        summary_p = card.select_one("p.card-text")
+    # Same rows as "div.card.card-elearning div.card-body": each body once, even in nested cards
+    bodies = (body for body in soup.find_all("div", class_="card-body")
+              if body.find_parent(_is_elearning_card) is not None)
+    for card in bodies:
+        heading = card.find("h5", class_="card-title")
+        a = heading.find("a", class_="title-link") if heading else None
+        date_tag = card.find("h6", class_="date")
+        summary_p = card.find("p", class_="card-text")
         title = a.get_text(strip=True) if a else ""
         href = a.get("href", "") if a else ""
         if href and href.startswith("/"):
             href = f"{BASE}{href}"
         date = date_tag.get_text(strip=True) if date_tag else ""
         summary = summary_p.get_text(" ", strip=True) if summary_p else ""
-        if any([title, date, href, summary]):
+        if title or date or href or summary:
             out.append((title, date, href, summary))
     return out
 
 
+_WS_RE = re.compile(r"\s+")
+
+
+# Listing fields repeat across pages; article bodies bypass the cache (see extract_main_text)
+@lru_cache(maxsize=8192)
 def normalize_space(text: str) -> str:
     if not text:
         return ""
     # Collapse whitespace and strip
-    return re.sub(r"\s+", " ", text).strip()
+    return _WS_RE.sub(" ", text).strip()
+
+
+try:
+    # One reusable parser instance instead of an import lookup per date string
+    from dateutil.parser import parser as _DateutilParser  # type: ignore  # pip install python-dateutil
+    _DATEUTIL_PARSE = _DateutilParser().parse
+except Exception:
+    _DATEUTIL_PARSE = None
 
 
 def try_dateutil_parse(date_str: str) -> Optional[datetime]:
-    try:
-        from dateutil.parser import parse as dt_parse  # type: ignore
-    except Exception:
+    if _DATEUTIL_PARSE is None:
         return None
     try:
-        return dt_parse(date_str, dayfirst=True, yearfirst=False)
+        return _DATEUTIL_PARSE(date_str, dayfirst=True, yearfirst=False)
     except Exception:
         return None
 
 
+# FAO listings almost always use "12 March 2024" / "12 Mar 2024"; match that directly
+_FAO_DATE_RE = re.compile(r"^(\d{1,2}) ([A-Za-z]+) (\d{4})$")
+_ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}")
+_DATE_FORMATS = (
+    "%d %B %Y", "%d %b %Y",
+    "%B %d, %Y", "%b %d, %Y",
+    "%Y-%m-%d",
+    "%d/%m/%Y", "%m/%d/%Y",
+    "%d.%m.%Y",
+)
+_MONTH_NAMES = (
+    "january", "february", "march", "april", "may", "june", "july",
+    "august", "september", "october", "november", "december",
+)
+_MONTHS: Dict[str, int] = {name: i for i, name in enumerate(_MONTH_NAMES, start=1)}
+_MONTHS.update({name[:3]: i for i, name in enumerate(_MONTH_NAMES, start=1)})
+_MONTHS["sept"] = 9
+
+
+@lru_cache(maxsize=4096)
 def parse_date_to_iso(date_str: str) -> Tuple[str, int, int]:
     """Return (YYYY-MM-DD, year, month) or ("", 0, 0) if unknown."""
     s = normalize_space(date_str)
     if not s:
         return "", 0, 0
 
-    # Try python-dateutil if available
-    dt = try_dateutil_parse(s)
-    if dt is None:
-        # Fallback to common formats
-        formats = [
-            "%d %B %Y", "%d %b %Y",
-            "%B %d, %Y", "%b %d, %Y",
-            "%Y-%m-%d",
-            "%d/%m/%Y", "%m/%d/%Y",
-            "%d.%m.%Y",
-        ]
-        for fmt in formats:
+    # Fast path for the common FAO format; anything unusual falls through to dateutil
+    m = _FAO_DATE_RE.match(s)
+    if m:
+        month = _MONTHS.get(m.group(2).lower())
+        if month:
+            day, year = int(m.group(1)), int(m.group(3))
             try:
-                dt = datetime.strptime(s, fmt)
-                break
-            except Exception:
-                dt = None
+                datetime(year, month, day)
+            except ValueError:
+                pass
+            else:
+                return f"{year:04d}-{month:02d}-{day:02d}", year, month
+
+    # ISO dates/timestamps parse natively in ~1µs
+    if _ISO_DATE_RE.match(s):
+        try:
+            dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
+            return dt.strftime("%Y-%m-%d"), dt.year, dt.month
+        except ValueError:
+            pass
+
+    # Common explicit formats are cheap to try; python-dateutil (slow) is the last resort
+    dt = None
+    for fmt in _DATE_FORMATS:
+        try:
+            dt = datetime.strptime(s, fmt)
+            break
+        except ValueError:
+            pass
+    if dt is None:
+        dt = try_dateutil_parse(s)
     if dt is None:
         return "", 0, 0
     return dt.strftime("%Y-%m-%d"), dt.year, dt.month
 
 
+# Define thematic areas with weighted keywords and phrases
+# Format: (category_name, ((keyword/phrase, weight), ...)); immutable, built once at import
+_THEMATIC_KEYWORDS: Tuple[Tuple[str, Tuple[Tuple[str, int], ...]], ...] = (
+    # Most specific categories first (higher priority)
+    ("Gender in fisheries and aquaculture", (
+        ("fisheries", 3), ("aquaculture", 3), ("fisher", 2), ("fishing", 2), 
+        ("fish value chain", 4), ("marine", 2), ("coastal", 2), ("seafood", 2)
+    )),
+    ("Gender in forestry and agroforestry", (
+        ("forestry", 3), ("forest", 2), ("agroforestry", 3), ("woodlot", 3), 
+        ("non-timber forest", 4), ("ntfp", 3), ("timber", 2), ("deforestation", 2)
+    )),
+    ("Gender and livestock", (
+        ("livestock", 3), ("pastoral", 3), ("pastoralist", 3), ("herd", 2), 
+        ("animal health", 4), ("small ruminant", 4), ("cattle", 2), ("goat", 2), 
+        ("sheep", 2), ("poultry", 2), ("dairy", 2)
+    )),
+    ("Gender and plant production and protection", (
+        ("plant production", 4), ("crop", 2), ("crop production", 4), 
+        ("plant protection", 4), ("ipm", 3), ("integrated pest", 4), 
+        ("seed", 2), ("agronomy", 3), ("plant health", 4), ("pesticide", 2)
+    )),
+    ("Gender and innovative and labour-saving technologies", (
+        ("innovation", 2), ("innovative", 2), ("technology", 2), ("technologies", 2), 
+        ("labour-saving", 4), ("labor-saving", 4), ("mechanization", 3), 
+        ("mechanisation", 3), ("tools", 2), ("equipment", 2), ("digital", 2),
+        ("ict", 3), ("mobile", 2), ("app", 2)
+    )),
+    ("Gender and land and water", (
+        ("land tenure", 4), ("land rights", 4), ("land", 2), ("water", 2), 
+        ("irrigation", 3), ("watershed", 3), ("water management", 4), 
+        ("land governance", 4), ("tenure", 3), ("property rights", 3)
+    )),
+    ("Gender and climate change, agroecology and biodiversity", (
+        ("climate", 2), ("climate change", 4), ("agroecology", 4), 
+        ("biodiversity", 3), ("mitigation", 3), ("adaptation", 3), 
+        ("emissions", 3), ("ecosystem", 3), ("nature-based", 4),
+        ("carbon", 2), ("greenhouse", 2), ("sustainability", 2)
+    )),
+    ("Gender and emergencies and resilience building", (
+        ("emergency", 3), ("humanitarian", 3), ("crisis", 3), ("conflict", 3), 
+        ("resilience", 3), ("shock", 3), ("disaster", 3), ("drm", 4), 
+        ("risk management", 4), ("recovery", 2), ("relief", 2)
+    )),
+    ("Gender-based violence and protection from sexual exploitation and abuse", (
+        ("gender-based violence", 4), ("gbv", 4), ("violence", 3), 
+        ("protection from sexual exploitation and abuse", 5), ("psea", 4), 
+        ("harassment", 3), ("safeguarding", 3), ("abuse", 3)
+    )),
+    ("Gender and rural financial services", (
+        ("finance", 2), ("financial services", 4), ("microfinance", 4), 
+        ("credit", 3), ("loans", 3), ("savings", 3), ("remittances", 3),
+        ("banking", 2), ("financial inclusion", 4)
+    )),
+    ("Gender and decent rural employment and child labour", (
+        ("decent work", 4), ("decent employment", 4), ("rural employment", 4), 
+        ("child labour", 4), ("child labor", 4), ("occupational safety", 4), 
+        ("oshea", 4), ("youth employment", 4), ("job", 2), ("workplace", 2)
+    )),
+    ("Gender and investment in sustainable agrifood systems", (
+        ("investment", 3), ("invest", 3), ("sustainable agrifood", 4), 
+        ("infrastructure", 3), ("capital", 3), ("financing", 3), 
+        ("public investment", 4), ("private investment", 4), ("funding", 2)
+    )),
+    ("Gender and rural advisory services", (
+        ("extension", 3), ("advisory services", 4), ("rural advisory", 4), 
+        ("farmer field school", 4), ("ffs", 4), ("capacity development", 4), 
+        ("training", 2), ("education", 2), ("knowledge transfer", 3)
+    )),
+    ("Gender-sensitive social protection", (
+        ("social protection", 4), ("cash transfer", 4), ("safety net", 4), 
+        ("social assistance", 4), ("insurance", 3), ("public works", 3),
+        ("welfare", 2), ("benefits", 2)
+    )),
+    ("Gender-responsive policy making and budgeting", (
+        ("policy", 2), ("policies", 2), ("policy-making", 4), ("policy making", 4), 
+        ("budget", 3), ("budgeting", 3), ("gender-responsive budget", 5), 
+        ("grb", 4), ("governance", 2), ("regulation", 2), ("legislation", 2),
+        ("law", 2), ("legal", 2)
+    )),
+    ("Gender statistics and sex-disaggregated data", (
+        ("sex-disaggregated", 4), ("sex disaggregated", 4), ("gender statistics", 4), 
+        ("disaggregated data", 4), ("indicator", 3), ("survey", 3), 
+        ("census", 3), ("data collection", 4), ("gender data", 4),
+        ("statistics", 2), ("metrics", 2)
+    )),
+    ("Gender and food security and nutrition", (
+        ("food security", 4), ("nutrition", 3), ("malnutrition", 4), 
+        ("diet", 2), ("food systems", 3), ("household food", 4), 
+        ("nutritious", 2), ("hunger", 2), ("stunting", 3), ("wasting", 3)
+    )),
+    ("Gender and inclusive food systems and value chains", (
+        ("inclusive", 2), ("value chain", 4), ("market access", 4), 
+        ("agrifood", 3), ("food system", 3), ("processing", 3), 
+        ("marketing", 3), ("inclusive business", 4), ("trade", 2),
+        ("supply chain", 3), ("distribution", 2)
+    )),
+    ("Gender analysis, gender mainstreaming and the project cycle", (
+        ("gender analysis", 4), ("gender mainstreaming", 4), ("mainstreaming", 3), 
+        ("project cycle", 4), ("logframe", 3), ("logical framework", 4), 
+        ("design phase", 4), ("implementation phase", 4), 
+        ("monitoring and evaluation", 4), ("m&e", 3), ("assessment", 2)
+    )),
+    # General category last (lowest priority)
+    ("Gender equality and women's empowerment", (
+        ("gender equality", 3), ("women", 1), ("girls", 1), ("empower", 2), 
+        ("empowerment", 2), ("leadership", 2), ("equity", 2), ("inclusion", 2), 
+        ("rights", 2), ("equal", 1), ("female", 1)
+    )),
+)
+
+# Curly quotes to their ASCII forms, in one translate() pass
+_PUNCT_MAP = str.maketrans({"\u2019": "'", "\u201c": '"', "\u201d": '"'})
+_DEFAULT_CATEGORY = "Gender equality and women's empowerment"
+_CATEGORY_LABELS: Tuple[str, ...] = tuple(label for label, _ in _THEMATIC_KEYWORDS)
+
+
+def _build_keyword_hits() -> Dict[str, Tuple[Tuple[int, int], ...]]:
+    """Map each keyword to its (category index, points) pairs, where points include
+    the +1 bonus for multi-word phrases. A keyword may appear in several categories.
+    """
+    hits: Dict[str, List[Tuple[int, int]]] = {}
+    for idx, (_, keyword_weights) in enumerate(_THEMATIC_KEYWORDS):
+        for keyword, weight in keyword_weights:
+            points = weight + (1 if len(keyword.split()) > 1 else 0)
+            # Matching runs on lowercased text, so keywords must be lowercase too
+            hits.setdefault(keyword.lower(), []).append((idx, points))
+    return {keyword: tuple(keyword_hits) for keyword, keyword_hits in hits.items()}
+
+
+_KEYWORD_HITS = _build_keyword_hits()
+
+
+def _build_keyword_automaton():
+    """Build one Aho-Corasick automaton over every thematic keyword."""
+    try:
+        import ahocorasick  # type: ignore  # pip install pyahocorasick
+    except ImportError:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in _KEYWORD_HITS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+
 def categorize_article(title: str, summary: str, section: str) -> str:
     """Categorize into FAO Gender Thematic Areas using improved keyword scoring.
     Returns one primary Thematic Area string from the predefined list.
     """
-    text = f"{title} {summary}".lower()
-    # Normalize common punctuation variants to improve matching
-    text = text.replace("'", "'").replace(""", '"').replace(""", '"')
-    
-    # Define thematic areas with weighted keywords and phrases
-    # Format: (category_name, [(keyword/phrase, weight), ...])
-    thematic_keywords = [
-        # Most specific categories first (higher priority)
-        ("Gender in fisheries and aquaculture", [
-            ("fisheries", 3), ("aquaculture", 3), ("fisher", 2), ("fishing", 2), 
-            ("fish value chain", 4), ("marine", 2), ("coastal", 2), ("seafood", 2)
-        ]),
-        ("Gender in forestry and agroforestry", [
-            ("forestry", 3), ("forest", 2), ("agroforestry", 3), ("woodlot", 3), 
-            ("non-timber forest", 4), ("ntfp", 3), ("timber", 2), ("deforestation", 2)
-        ]),
-        ("Gender and livestock", [
-            ("livestock", 3), ("pastoral", 3), ("pastoralist", 3), ("herd", 2), 
-            ("animal health", 4), ("small ruminant", 4), ("cattle", 2), ("goat", 2), 
-            ("sheep", 2), ("poultry", 2), ("dairy", 2)
-        ]),
-        ("Gender and plant production and protection", [
-            ("plant production", 4), ("crop", 2), ("crop production", 4), 
-            ("plant protection", 4), ("ipm", 3), ("integrated pest", 4), 
-            ("seed", 2), ("agronomy", 3), ("plant health", 4), ("pesticide", 2)
-        ]),
-        ("Gender and innovative and labour-saving technologies", [
-            ("innovation", 2), ("innovative", 2), ("technology", 2), ("technologies", 2), 
-            ("labour-saving", 4), ("labor-saving", 4), ("mechanization", 3), 
-            ("mechanisation", 3), ("tools", 2), ("equipment", 2), ("digital", 2),
-            ("ict", 3), ("mobile", 2), ("app", 2)
-        ]),
-        ("Gender and land and water", [
-            ("land tenure", 4), ("land rights", 4), ("land", 2), ("water", 2), 
-            ("irrigation", 3), ("watershed", 3), ("water management", 4), 
-            ("land governance", 4), ("tenure", 3), ("property rights", 3)
-        ]),
-        ("Gender and climate change, agroecology and biodiversity", [
-            ("climate", 2), ("climate change", 4), ("agroecology", 4), 
-            ("biodiversity", 3), ("mitigation", 3), ("adaptation", 3), 
-            ("emissions", 3), ("ecosystem", 3), ("nature-based", 4),
-            ("carbon", 2), ("greenhouse", 2), ("sustainability", 2)
-        ]),
-        ("Gender and emergencies and resilience building", [
-            ("emergency", 3), ("humanitarian", 3), ("crisis", 3), ("conflict", 3), 
-            ("resilience", 3), ("shock", 3), ("disaster", 3), ("drm", 4), 
-            ("risk management", 4), ("recovery", 2), ("relief", 2)
-        ]),
-        ("Gender-based violence and protection from sexual exploitation and abuse", [
-            ("gender-based violence", 4), ("gbv", 4), ("violence", 3), 
-            ("protection from sexual exploitation and abuse", 5), ("psea", 4), 
-            ("harassment", 3), ("safeguarding", 3), ("abuse", 3)
-        ]),
-        ("Gender and rural financial services", [
-            ("finance", 2), ("financial services", 4), ("microfinance", 4), 
-            ("credit", 3), ("loans", 3), ("savings", 3), ("remittances", 3),
-            ("banking", 2), ("financial inclusion", 4)
-        ]),
-        ("Gender and decent rural employment and child labour", [
-            ("decent work", 4), ("decent employment", 4), ("rural employment", 4), 
-            ("child labour", 4), ("child labor", 4), ("occupational safety", 4), 
-            ("oshea", 4), ("youth employment", 4), ("job", 2), ("workplace", 2)
-        ]),
-        ("Gender and investment in sustainable agrifood systems", [
-            ("investment", 3), ("invest", 3), ("sustainable agrifood", 4), 
-            ("infrastructure", 3), ("capital", 3), ("financing", 3), 
-            ("public investment", 4), ("private investment", 4), ("funding", 2)
-        ]),
-        ("Gender and rural advisory services", [
-            ("extension", 3), ("advisory services", 4), ("rural advisory", 4), 
-            ("farmer field school", 4), ("ffs", 4), ("capacity development", 4), 
-            ("training", 2), ("education", 2), ("knowledge transfer", 3)
-        ]),
-        ("Gender-sensitive social protection", [
-            ("social protection", 4), ("cash transfer", 4), ("safety net", 4), 
-            ("social assistance", 4), ("insurance", 3), ("public works", 3),
-            ("welfare", 2), ("benefits", 2)
-        ]),
-        ("Gender-responsive policy making and budgeting", [
-            ("policy", 2), ("policies", 2), ("policy-making", 4), ("policy making", 4), 
-            ("budget", 3), ("budgeting", 3), ("gender-responsive budget", 5), 
-            ("grb", 4), ("governance", 2), ("regulation", 2), ("legislation", 2),
-            ("law", 2), ("legal", 2)
-        ]),
-        ("Gender statistics and sex-disaggregated data", [
-            ("sex-disaggregated", 4), ("sex disaggregated", 4), ("gender statistics", 4), 
-            ("disaggregated data", 4), ("indicator", 3), ("survey", 3), 
-            ("census", 3), ("data collection", 4), ("gender data", 4),
-            ("statistics", 2), ("metrics", 2)
-        ]),
-        ("Gender and food security and nutrition", [
-            ("food security", 4), ("nutrition", 3), ("malnutrition", 4), 
-            ("diet", 2), ("food systems", 3), ("household food", 4), 
-            ("nutritious", 2), ("hunger", 2), ("stunting", 3), ("wasting", 3)
-        ]),
-        ("Gender and inclusive food systems and value chains", [
-            ("inclusive", 2), ("value chain", 4), ("market access", 4), 
-            ("agrifood", 3), ("food system", 3), ("processing", 3), 
-            ("marketing", 3), ("inclusive business", 4), ("trade", 2),
-            ("supply chain", 3), ("distribution", 2)
-        ]),
-        ("Gender analysis, gender mainstreaming and the project cycle", [
-            ("gender analysis", 4), ("gender mainstreaming", 4), ("mainstreaming", 3), 
-            ("project cycle", 4), ("logframe", 3), ("logical framework", 4), 
-            ("design phase", 4), ("implementation phase", 4), 
-            ("monitoring and evaluation", 4), ("m&e", 3), ("assessment", 2)
-        ]),
-        # General category last (lowest priority)
-        ("Gender equality and women's empowerment", [
-            ("gender equality", 3), ("women", 1), ("girls", 1), ("empower", 2), 
-            ("empowerment", 2), ("leadership", 2), ("equity", 2), ("inclusion", 2), 
-            ("rights", 2), ("equal", 1), ("female", 1)
-        ]),
-    ]
+    # Lowercase and normalize common punctuation variants to improve matching
+    text = f"{title} {summary}".lower().translate(_PUNCT_MAP)
+    return _categorize_text(text)
+
+
+@lru_cache(maxsize=4096)
+def _categorize_text(text: str) -> str:
+    """Score lowercased, punctuation-normalized text; cached on the text alone."""
+    # Each keyword counts once however often it occurs
+    if _KEYWORD_AUTOMATON is not None:
+        matched = {keyword for _, keyword in _KEYWORD_AUTOMATON.iter(text)}
+    else:
+        # Without pyahocorasick, one C-level substring search per keyword; this beats a
+        # single overlapping-match regex, which retries the whole alternation at every position
+        matched = {keyword for keyword in _KEYWORD_HITS if keyword in text}
+
+    # Nothing matched (common for e-learning/publications): skip scoring entirely
+    if not matched:
+        return _DEFAULT_CATEGORY
+
+    scores = [0] * len(_CATEGORY_LABELS)
+    for keyword in matched:
+        for idx, points in _KEYWORD_HITS[keyword]:
+            scores[idx] += points
+    best_score = max(scores)
 
-    best_category = "Gender equality and women's empowerment"  # Default fallback
-    best_score = 0
-    
-    for category_label, keyword_weights in thematic_keywords:
-        score = 0
-        for keyword, weight in keyword_weights:
-            if keyword in text:
-                score += weight
-                # Bonus for exact phrase matches
-                if len(keyword.split()) > 1:
-                    score += 1
-        if score > best_score:
-            best_score = score
-            best_category = category_label
-    
     # If no specific category scored well, use the general one
     if best_score < 2:
-        return "Gender equality and women's empowerment"
-    
-    return best_category
+        return _DEFAULT_CATEGORY
+
+    # Ties go to the earlier (more specific) category
+    return _CATEGORY_LABELS[scores.index(best_score)]
+
+
+def _xpath_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# XPath equivalents of the CSS selectors in _extract_main_text_bs4, same order
+_ARTICLE_NOISE_XPATH = (
+    "//script|//style|//nav|//header|//footer|//aside|//form|//noscript"
+    f"|//div[{_xpath_class('share')}]|//div[{_xpath_class('social')}]|//ul[{_xpath_class('share-buttons')}]"
+)
+_ARTICLE_CANDIDATE_XPATHS = (
+    "//article", "//main//article", f"//main//*[{_xpath_class('article')}]",
+    f"//div[{_xpath_class('article')}]", f"//div[{_xpath_class('article-content')}]",
+    f"//div[{_xpath_class('entry-content')}]", "//div[@id='content']", "//main",
+    f"//section[{_xpath_class('content')}]", f"//div[{_xpath_class('content')}]",
+    f"//div[{_xpath_class('text')}]", "//div[@id='main-content']",
+)
+
+
+def _lxml_node_text(node) -> str:
+    # Same as bs4's get_text(" ", strip=True)
+    return " ".join(t for t in (s.strip() for s in node.itertext()) if t)
+
+
+def _extract_main_text_lxml(html: str) -> Optional[str]:
+    try:
+        tree = lxml_html.fromstring(html)
+    except (ValueError, lxml_html.etree.ParserError):
+        # Empty documents, or str input carrying an XML encoding declaration
+        return None
+    for n in tree.xpath(_ARTICLE_NOISE_XPATH):
+        # Empty the node but keep its tail as a separate text node (drop_tree() would glue
+        # it onto the previous text, unlike bs4's decompose()); attributes go too, so a
+        # cleared node can no longer match the candidate XPaths
+        n.clear(keep_tail=True)
+
+    best = ""
+    best_len = 0
+    for xpath in _ARTICLE_CANDIDATE_XPATHS:
+        nodes = tree.xpath(xpath)
+        if not nodes:
+            continue
+        text = "\n".join([_lxml_node_text(p) for p in nodes[0].xpath(".//p|.//li")])
+        if len(text) > best_len:
+            best = text
+            best_len = len(text)
+    if not best:
+        best = "\n".join([_lxml_node_text(p) for p in tree.xpath("//p")])
+    # Uncached whitespace collapse: article bodies are large and rarely repeat
+    return _WS_RE.sub(" ", best).strip()
 
 
 def extract_main_text(html: str) -> str:
     """Extract main article text with heuristic selectors and paragraph join."""
-    soup = BeautifulSoup(html, "html.parser")
+    if lxml_html is not None:
+        text = _extract_main_text_lxml(html)
+        if text is not None:
+            return text
+    return _extract_main_text_bs4(html)
+
+
+def _extract_main_text_bs4(html: str) -> str:
+    soup = BeautifulSoup(html, HTML_PARSER)
     for sel in [
         "script", "style", "nav", "header", "footer", "aside", "form", "noscript",
         "div.share", "div.social", "ul.share-buttons",
@@ -374,116 +678,213 @@ def extract_main_text(html: str) -> str:
             best_len = len(text)
     if not best:
         best = "\n".join([p.get_text(" ", strip=True) for p in soup.find_all("p")])
-    return normalize_space(best)
+    # Uncached whitespace collapse: article bodies are large and rarely repeat
+    return _WS_RE.sub(" ", best).strip()
+
+
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[\.!?])\s+")
+_WORD_RE = re.compile(r"[A-Za-z']+")
+_STOPWORDS = frozenset("""
+    a an the and or but if while of for on in at to from by with as is are was were be been being
+    this that those these it its they them their we our you your he she his her not no yes do does did
+""".split())
 
 
 def summarize_text(text: str, max_sentences: int = 3) -> str:
     if not text:
         return ""
-    sentences = re.split(r"(?<=[\.!?])\s+", text)
+    sentences = _SENTENCE_SPLIT_RE.split(text)
     sentences = [s.strip() for s in sentences if s.strip()]
     if len(sentences) <= max_sentences:
         return " ".join(sentences)
 
-    stop = set("""
-        a an the and or but if while of for on in at to from by with as is are was were be been being
-        this that those these it its they them their we our you your he she his her not no yes do does did
-    """.split())
-    words = re.findall(r"[A-Za-z']+", text.lower())
-    freq: Dict[str, int] = {}
-    for w in words:
-        if w in stop or len(w) <= 2:
-            continue
-        freq[w] = freq.get(w, 0) + 1
-
-    scores: List[Tuple[int, int]] = []
-    for idx, s in enumerate(sentences):
-        score = 0
-        for w in re.findall(r"[A-Za-z']+", s.lower()):
-            score += freq.get(w, 0)
-        scores.append((score, idx))
-    top = sorted(scores, key=lambda x: x[0], reverse=True)[:max_sentences]
+    # Tokenize each sentence once; sentences only split on whitespace, so together
+    # they hold exactly the words of the whole text
+    sentence_words = [_WORD_RE.findall(s.lower()) for s in sentences]
+    freq = Counter(
+        w for words in sentence_words for w in words if len(w) > 2 and w not in _STOPWORDS
+    )
+
+    scores = [(sum(freq.get(w, 0) for w in words), idx) for idx, words in enumerate(sentence_words)]
+    # nlargest with a key is stable like sorted(), so ties keep the earlier sentence
+    top = heapq.nlargest(max_sentences, scores, key=itemgetter(0))
     top_idx = sorted([i for _, i in top])
     return " ".join([sentences[i] for i in top_idx])
 
 
-def scrape(section: str, start_page: int, max_pages: int, delay: float,
-           fetch_article: bool = False, summarize: bool = False, summary_sentences: int = 3) -> List[Item]:
-    session = make_session()
-    results: List[Item] = []
+def fetch_article_text(session: requests.Session, url: str) -> str:
+    """Download an article page and extract its main text; "" on any failure."""
+    try:
+        resp = session.get(url, timeout=45)
+        if resp.status_code == 200:
+            return extract_main_text(resp.text)
+    except Exception:
+        pass
+    return ""
+
+
+def iter_items(section: str, start_page: int, max_pages: int, delay: float,
+               fetch_article: bool = False, summarize: bool = False, summary_sentences: int = 3,
+               concurrency: int = 4, http_cache_path: Optional[str] = None,
+               parse_workers: int = 0, article_concurrency: int = 8) -> Iterator[Item]:
+    """Yield items page by page as they are scraped, so callers can stream them to disk.
+    With parse_workers > 0, listing HTML is parsed in a process pool as soon as each
+    page arrives, overlapping parsing with the remaining downloads. With fetch_article,
+    up to article_concurrency article pages are downloaded at once.
+    """
+    http_cache = load_http_cache(http_cache_path)
     parser: Callable[[str], List[Tuple[str, str, str, str]]]
     parser = parse_listing_elearning if section == "e-learning" else parse_listing_generic
+    concurrency = max(1, concurrency)
+    article_concurrency = max(1, article_concurrency)
+    session = make_session(pool_size=max(32, concurrency))
+    article_session = make_article_session(pool_size=max(32, article_concurrency))
 
     page = start_page
     pages_fetched = 0
-    while True:
-        if pages_fetched >= max_pages:
-            break
-        url = build_page_url(section, page)
-        resp = session.get(url, timeout=30)
-        status = resp.status_code
-        if status != 200:
-            # Stop on 404 or break on consecutive non-200s
-            # Print to stderr for visibility but keep going if later pages might exist
-            print(f"WARN: HTTP {status} for {url}", file=sys.stderr)
-            if status == 404:
-                break
-        html = resp.text
-        rows = parser(html)
-        if not rows:
-            # No more items; stop
-            break
-        for title, date, href, summary in rows:
-            clean_title = normalize_space(title)
-            clean_summary = normalize_space(summary)
-            date_iso, year, month = parse_date_to_iso(date)
-            category = categorize_article(clean_title, clean_summary, section)
-            article_text = ""
-            article_summary = ""
-            if fetch_article and href:
-                try:
-                    aresp = session.get(href, timeout=45)
-                    if aresp.status_code == 200:
-                        article_text = extract_main_text(aresp.text)
+    done = False
+    # Listing pages are fetched in batches of `concurrency` so network latency overlaps;
+    # pages are processed in order, so the stop-on-404 / stop-on-empty-page behaviour
+    # is unchanged.
+    with ExitStack() as stack:
+        stack.enter_context(session)
+        stack.enter_context(article_session)
+        pool = stack.enter_context(ThreadPoolExecutor(max_workers=concurrency))
+        article_pool = stack.enter_context(ThreadPoolExecutor(max_workers=article_concurrency))
+        parse_pool: Optional[ProcessPoolExecutor] = None
+        if parse_workers > 0:
+            # "spawn", not Linux's default fork: workers start on the first submit(), which
+            # happens on a fetch thread while sibling threads may hold locks mid-request
+            parse_pool = stack.enter_context(ProcessPoolExecutor(
+                max_workers=parse_workers, mp_context=multiprocessing.get_context("spawn"),
+            ))
+
+        def fetch_listing(
+            args: Tuple[str, Dict[str, str], Optional[str]],
+        ) -> Tuple[requests.Response, str, Optional[Future]]:
+            url, headers, cached_hash = args
+            resp = session.get(url, headers=headers, timeout=30)
+            body_hash = body_digest(resp.content)
+            parsed = None
+            if parse_pool is not None and resp.status_code == 200 and body_hash != cached_hash:
+                parsed = parse_pool.submit(parser, resp.text)
+            return resp, body_hash, parsed
+
+        while not done and pages_fetched < max_pages:
+            batch = list(range(page, page + min(concurrency, max_pages - pages_fetched)))
+            urls = [build_page_url(section, p) for p in batch]
+            requests_args = [
+                (u, conditional_headers(http_cache.get(u)), http_cache.get(u, {}).get("body_blake2b"))
+                for u in urls
+            ]
+            responses = pool.map(fetch_listing, requests_args)
+            batch_rows: List[Tuple[int, List[Tuple[str, str, str, str]]]] = []
+            for page, url, (resp, body_hash, parsed) in zip(batch, urls, responses):
+                status = resp.status_code
+                cached = http_cache.get(url)
+                if status == 304 and cached is not None:
+                    # Unchanged since the last run: reuse the rows parsed back then
+                    rows = [tuple(r) for r in cached.get("rows", [])]
+                else:
+                    if status != 200:
+                        # Stop on 404 or break on consecutive non-200s
+                        # Print to stderr for visibility but keep going if later pages might exist
+                        print(f"WARN: HTTP {status} for {url}", file=sys.stderr)
+                        if status == 404:
+                            done = True
+                            break
+                    if status == 200 and cached is not None and cached.get("body_blake2b") == body_hash:
+                        # 200 without usable validators, but the HTML is byte-identical: skip parsing
+                        rows = [tuple(r) for r in cached.get("rows", [])]
+                    else:
+                        rows = parsed.result() if parsed is not None else parser(resp.text)
+                    if status == 200:
+                        http_cache[url] = {
+                            "etag": resp.headers.get("ETag"),
+                            "last_modified": resp.headers.get("Last-Modified"),
+                            "body_blake2b": body_hash,
+                            "rows": rows,
+                        }
+                if not rows:
+                    # No more items; stop
+                    done = True
+                    break
+                batch_rows.append((page, rows))
+                pages_fetched += 1
+
+            # Start every article download for the batch up front so they overlap; text
+            # extraction runs in the same worker threads (lxml parses outside the GIL)
+            article_texts: Dict[str, Future] = {}
+            if fetch_article:
+                for _, rows in batch_rows:
+                    for _, _, href, _ in rows:
+                        if href and href not in article_texts:
+                            article_texts[href] = article_pool.submit(fetch_article_text, article_session, href)
+
+            for page, rows in batch_rows:
+                for title, date, href, summary in rows:
+                    clean_title = normalize_space(title)
+                    clean_summary = normalize_space(summary)
+                    clean_date = normalize_space(date)
+                    date_iso, year, month = parse_date_to_iso(clean_date)
+                    category = categorize_article(clean_title, clean_summary, section)
+                    article_text = ""
+                    article_summary = ""
+                    if fetch_article and href:
+                        article_text = article_texts[href].result()
                         if summarize and article_text:
                             article_summary = summarize_text(article_text, max_sentences=summary_sentences)
-                except Exception:
-                    pass
-            if summarize and not article_summary and clean_summary:
-                article_summary = summarize_text(clean_summary, max_sentences=summary_sentences)
-
-            results.append(Item(
-                section=section,
-                page=page,
-                title=clean_title,
-                date=normalize_space(date),
-                date_iso=date_iso,
-                year=year,
-                month=month,
-                category=category,
-                url=href,
-                summary=clean_summary,
-                article_summary=article_summary,
-                article_text=article_text,
-            ))
-        pages_fetched += 1
-        page += 1
-        if delay > 0:
-            time.sleep(delay)
-    return results
-
-
-def write_csv(items: List[Item], out_path: str) -> None:
-    # Sort items by date (desc), then section, then title
-    def sort_key(it: Item) -> Tuple[int, str, str]:
-        # Use YYYYMMDD as int if available, else 0
-        if it.date_iso:
-            ymd = int(it.date_iso.replace("-", ""))
-        else:
-            ymd = 0
-        return (ymd, it.section.lower(), it.title.lower())
+                    if summarize and not article_summary and clean_summary:
+                        article_summary = summarize_text(clean_summary, max_sentences=summary_sentences)
+
+                    yield Item(
+                        section=section,
+                        page=page,
+                        title=clean_title,
+                        date=clean_date,
+                        date_iso=date_iso,
+                        year=year,
+                        month=month,
+                        category=category,
+                        url=href,
+                        summary=clean_summary,
+                        article_summary=article_summary,
+                        article_text=article_text,
+                    )
+            page = batch[-1] + 1
+            if delay > 0 and not done:
+                time.sleep(delay)
+    save_http_cache(http_cache, http_cache_path)
+
+
+def scrape(section: str, start_page: int, max_pages: int, delay: float,
+           fetch_article: bool = False, summarize: bool = False, summary_sentences: int = 3,
+           concurrency: int = 4, http_cache_path: Optional[str] = None,
+           parse_workers: int = 0, article_concurrency: int = 8) -> List[Item]:
+    return list(iter_items(
+        section, start_page, max_pages, delay,
+        fetch_article=fetch_article,
+        summarize=summarize,
+        summary_sentences=summary_sentences,
+        concurrency=concurrency,
+        http_cache_path=http_cache_path,
+        parse_workers=parse_workers,
+        article_concurrency=article_concurrency,
+    ))
+
 
-    sorted_items = sorted(items, key=sort_key, reverse=True)
+def write_csv(items: Iterable[Item], out_path: str) -> None:
+    """Write items sorted by date. Unlike write_json this cannot stream: the sort needs
+    every row, so callers should pass items without article_text (see main()).
+    """
+    # Sort items by date (desc), then section, then title.
+    # sorted() computes each key once per item (decorate-sort-undecorate), and ISO
+    # dates order correctly as strings ("" for unknown sorts last), so no int parsing.
+    sorted_items = sorted(
+        items,
+        key=lambda it: (it.date_iso, it.section.lower(), it.title.lower()),
+        reverse=True,
+    )
 
     fieldnames = [
         "section",
@@ -504,25 +905,59 @@ def write_csv(items: List[Item], out_path: str) -> None:
     if out_dir:
         os.makedirs(out_dir, exist_ok=True)
     # Use utf-8-sig for better Excel compatibility and quote all fields for presentation
+    # Read the columns straight off each item rather than building an asdict() copy per row
+    row_values = attrgetter(*fieldnames)
     with open(out_path, "w", newline="", encoding="utf-8-sig") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore", quoting=csv.QUOTE_ALL)
-        writer.writeheader()
-        for it in sorted_items:
-            writer.writerow(asdict(it))
+        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+        writer.writerow(fieldnames)
+        writer.writerows(row_values(it) for it in sorted_items)
 
 
-def write_json(items: List[Item], out_path: str) -> None:
+def dump_json_bytes(data: Dict) -> bytes:
+    """Indented UTF-8 JSON, via orjson when installed (several times faster than json)."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def write_json(items: Iterable[Item], out_path: str) -> int:
+    """Stream items into the JSON payload as they are produced and return the count.
+    Output goes to a temporary file that only replaces out_path when at least one item
+    was written, so an empty or failed scrape leaves the previous file untouched.
+    """
     # Ensure directory exists
     out_dir = os.path.dirname(out_path)
     if out_dir:
         os.makedirs(out_dir, exist_ok=True)
-    data = [asdict(it) for it in items]
-    with open(out_path, "w", encoding="utf-8") as f:
-        json.dump({
-            "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
-            "count": len(items),
-            "items": data,
-        }, f, ensure_ascii=False, indent=2)
+    # A unique temporary file in the target directory, so concurrent runs for the same
+    # section cannot clobber each other and os.replace stays on one filesystem
+    tmp = tempfile.NamedTemporaryFile(
+        "wb", dir=out_dir or ".", prefix=f".{os.path.basename(out_path)}.", suffix=".tmp", delete=False
+    )
+    tmp_path = tmp.name
+    count = 0
+    try:
+        with tmp as f:
+            generated_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+            f.write(f'{{\n  "generated_at": "{generated_at}",\n  "items": ['.encode("utf-8"))
+            for it in items:
+                f.write(b",\n    " if count else b"\n    ")
+                # Same layout as json.dump(..., indent=2) for an item nested two levels deep
+                f.write(dump_json_bytes(it._asdict()).replace(b"\n", b"\n    "))
+                count += 1
+            f.write(f'\n  ],\n  "count": {count}\n}}'.encode("utf-8"))
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    if count:
+        # NamedTemporaryFile creates the file 0600; give the output the usual umask-based mode
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp_path, 0o666 & ~umask)
+        os.replace(tmp_path, out_path)
+    else:
+        os.remove(tmp_path)
+    return count
 
 
 def main() -> None:
@@ -535,20 +970,61 @@ def main() -> None:
     ap.add_argument("--start-page", type=int, default=1, help="Start at this page number (default: 1)")
     ap.add_argument("--max-pages", type=int, default=10,
                     help="Maximum number of pages to fetch (stops early if a page has no items). Default 10.")
-    ap.add_argument("--delay", type=float, default=0.8, help="Seconds to sleep between page requests (default: 0.8)")
+    ap.add_argument("--delay", type=float, default=0.8, help="Seconds to sleep between batches of page requests (default: 0.8)")
+    ap.add_argument("--concurrency", type=int, default=4,
+                    help="Number of listing pages fetched in parallel; 1 fetches serially (default: 4)")
     ap.add_argument("--out", default=None, help=(
         "Output CSV path. If omitted, writes to public/<section>.csv"
     ))
     ap.add_argument("--json-out", default=None, help=(
         "Optional JSON output path (default: match CSV basename with .json)"
     ))
+    ap.add_argument("--parse-workers", type=int, default=0, help=(
+        "Parse listing pages in this many worker processes while downloads continue "
+        "(e.g. the number of CPU cores); 0 parses on the main thread (default: 0)"
+    ))
+    ap.add_argument("--http-cache", default=None, help=(
+        "Listing cache file (ETag/Last-Modified, body hash and parsed rows per listing URL). "
+        "Default: .cache/fao_http_cache.json at the repo root"
+    ))
+    ap.add_argument("--no-http-cache", action="store_true",
+                    help="Always download every listing page in full")
     ap.add_argument("--fetch-article", action="store_true", help="Fetch each article page and extract main text")
+    ap.add_argument("--article-concurrency", type=int, default=8,
+                    help="Number of article pages fetched in parallel with --fetch-article (default: 8)")
     ap.add_argument("--summarize", action="store_true", help="Generate an extractive summary")
     ap.add_argument("--summary-sentences", type=int, default=3, help="Number of sentences in the summary (default: 3)")
     args = ap.parse_args()
 
+    # Resolve repository root relative to this script's directory
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    repo_root = os.path.dirname(script_dir)
+    http_cache_path = None
+    if not args.no_http_cache:
+        http_cache_path = args.http_cache or os.path.join(repo_root, ".cache", "fao_http_cache.json")
+
+    # Determine output paths; default to repoRoot/public/<section>.csv
+    out_path = args.out
+    if not out_path:
+        out_filename = f"{args.section}.csv"
+        out_path = os.path.join(repo_root, "public", out_filename)
+    # Derive JSON path if not provided
+    json_out = args.json_out
+    if not json_out:
+        base = out_path.rsplit('.', 1)[0] if '.' in out_path else out_path
+        json_out = f"{base}.json"
+
+    # JSON is streamed as items arrive; the CSV is sorted, so keep its rows until the end.
+    # It has no article_text column, so full article bodies are not held in memory.
+    csv_items: List[Item] = []
+
+    def keep_for_csv(items: Iterable[Item]) -> Iterator[Item]:
+        for it in items:
+            csv_items.append(it._replace(article_text="") if it.article_text else it)
+            yield it
+
     try:
-        items = scrape(
+        count = write_json(keep_for_csv(iter_items(
             section=args.section,
             start_page=args.start_page,
             max_pages=args.max_pages,
@@ -556,31 +1032,20 @@ def main() -> None:
             fetch_article=args.fetch_article,
             summarize=args.summarize,
             summary_sentences=max(1, min(8, args.summary_sentences)),
-        )
+            concurrency=args.concurrency,
+            http_cache_path=http_cache_path,
+            parse_workers=max(0, args.parse_workers),
+            article_concurrency=args.article_concurrency,
+        )), json_out)
     except Exception as e:
         print(f"ERROR: {e}", file=sys.stderr)
         sys.exit(2)
 
-    if not items:
+    if not count:
         print("No items scraped. Try reducing delay, increasing max-pages, or running from a different network.")
     else:
-        # Determine output paths; default to repoRoot/public/<section>.csv
-        out_path = args.out
-        if not out_path:
-            # Resolve repository root relative to this script's directory
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            repo_root = os.path.dirname(script_dir)
-            out_filename = f"{args.section}.csv"
-            out_path = os.path.join(repo_root, "public", out_filename)
-
-        write_csv(items, out_path)
-        # Derive JSON path if not provided
-        json_out = args.json_out
-        if not json_out:
-            base = out_path.rsplit('.', 1)[0] if '.' in out_path else out_path
-            json_out = f"{base}.json"
-        write_json(items, json_out)
-        print(f"Wrote {len(items)} rows to {out_path} and JSON to {json_out}")
+        write_csv(csv_items, out_path)
+        print(f"Wrote {count} rows to {out_path} and JSON to {json_out}")
 
 if __name__ == "__main__":
     main()